@@ -1,105 +1,174 @@
 """
 Generate realistic SSH authentication logs with security anomalies
 Fixed: Space-padded days, realistic usernames, year boundary handling
+Optimized: Vectorized NumPy generation instead of per-entry Python loop
 """
-import random
 import os
 from datetime import datetime, timedelta
 
-def generate_sample_logs(filename='ssh_auth.log', num_entries=5000, output_dir='data/raw'):
+import numpy as np
+import pandas as pd
+
+def generate_sample_logs(filename='ssh_auth.log', num_entries=5000, output_dir='data/raw',
+                         output_format='log'):
     """
     Generates sample SSH authentication logs with:
     - Normal user activity
     - Brute force attack patterns
     - Suspicious geographic access
     - Failed login attempts
-    
+
     Args:
         filename: Output log filename
         num_entries: Number of log entries to generate
         output_dir: Output directory path
+        output_format: 'log' for syslog text (+ TSV sidecar), 'parquet' for a
+                       columnar file the pipeline loads without text parsing
     """
-    
+
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
-    
+
     # Realistic IP pools
-    normal_ips = [
+    normal_ips = np.array([
         '192.168.1.10', '192.168.1.15', '192.168.1.20',
         '10.0.0.5', '10.0.0.8', '172.16.0.100', '172.20.1.50'
-    ]
-    
+    ])
+
     # Attacker IPs (will show brute force pattern)
-    attacker_ips = [
+    attacker_ips = np.array([
         '45.142.212.61',  # Russia
         '103.75.201.12',  # China
         '185.220.101.45', # Tor exit node
-    ]
-    
+    ])
+
     # Suspicious country IPs
-    suspicious_ips = [
+    suspicious_ips = np.array([
         '91.108.56.190',  # Kazakhstan
         '196.201.233.45', # Nigeria
         '41.60.232.191',  # Kenya
-    ]
-    
+    ])
+
     # FIXED: Usernames without special characters for regex compatibility
-    normal_users = ['admin', 'johndoe', 'janesmith', 'devops', 'support', 'backup']
-    common_attack_users = ['root', 'admin', 'user', 'test', 'oracle', 'postgres', 'mysql']
-    
+    normal_users = np.array(['admin', 'johndoe', 'janesmith', 'devops', 'support', 'backup'])
+    common_attack_users = np.array(['root', 'admin', 'user', 'test', 'oracle', 'postgres', 'mysql'])
+    all_users = np.concatenate([normal_users, common_attack_users])
+
     base_time = datetime.now() - timedelta(days=7)
-    
+
     filepath = os.path.join(output_dir, filename)
-    
-    with open(filepath, 'w') as f:
-        for i in range(num_entries):
-            timestamp = base_time + timedelta(seconds=i*10 + random.randint(0, 30))
-            
-            # Decide event type
-            event_type = random.choices(
-                ['normal', 'brute_force', 'suspicious_geo', 'failed_normal'],
-                weights=[70, 15, 10, 5]
-            )[0]
-            
-            if event_type == 'normal':
-                ip = random.choice(normal_ips)
-                user = random.choice(normal_users)
-                status = random.choices(['Accepted', 'Failed'], weights=[95, 5])[0]
-                
-            elif event_type == 'brute_force':
-                ip = random.choice(attacker_ips)
-                user = random.choice(common_attack_users)
-                status = 'Failed'  # Brute force attempts usually fail
-                
-            elif event_type == 'suspicious_geo':
-                ip = random.choice(suspicious_ips)
-                user = random.choice(normal_users + common_attack_users)
-                status = random.choices(['Failed', 'Accepted'], weights=[80, 20])[0]
-                
-            else:  # failed_normal
-                ip = random.choice(normal_ips)
-                user = random.choice(normal_users)
-                status = 'Failed'
-            
-            # FIXED: Space-padded day format (e.g., "Jan  1" not "Jan 01")
-            month = timestamp.strftime('%b')
-            day = timestamp.strftime('%d').lstrip('0').rjust(2)  # Space-padded
-            time = timestamp.strftime('%H:%M:%S')
-            
-            if status == 'Accepted':
-                log_line = f"{month} {day} {time} server sshd[{random.randint(1000, 9999)}]: Accepted password for {user} from {ip} port {random.randint(40000, 60000)} ssh2\n"
-            else:
-                log_line = f"{month} {day} {time} server sshd[{random.randint(1000, 9999)}]: Failed password for {user} from {ip} port {random.randint(40000, 60000)} ssh2\n"
-            
-            f.write(log_line)
-    
+
+    n = num_entries
+    rng = np.random.default_rng()
+
+    # OPTIMIZED: Draw everything for all N entries in single vectorized calls
+    # instead of N iterations of random.choice/randint (pure Python dispatch)
+
+    # Event types: 0=normal, 1=brute_force, 2=suspicious_geo, 3=failed_normal
+    event_idx = rng.choice(4, size=n, p=[0.70, 0.15, 0.10, 0.05])
+
+    # Timestamps: monotonic 10s steps with 0-30s jitter, formatted in one pass
+    offsets = np.arange(n) * 10 + rng.integers(0, 31, size=n)
+    timestamps = pd.Series(
+        pd.to_datetime(base_time) + pd.to_timedelta(offsets, unit='s')
+    )
+
+    # Sample each pool only for the rows that drew its event type: grouped
+    # flatnonzero index assignment writes each category in one contiguous
+    # burst instead of drawing 3x full-size candidate arrays and selecting
+    # (normal and failed_normal share the internal pools)
+    ip_pools = {0: normal_ips, 1: attacker_ips, 2: suspicious_ips, 3: normal_ips}
+    user_pools = {0: normal_users, 1: common_attack_users, 2: all_users, 3: normal_users}
+
+    ips = np.empty(n, dtype=np.result_type(normal_ips, attacker_ips, suspicious_ips))
+    users = np.empty(n, dtype=all_users.dtype)
+    for code in range(4):
+        idx = np.flatnonzero(event_idx == code)
+        if idx.size:
+            ip_pool, user_pool = ip_pools[code], user_pools[code]
+            ips[idx] = ip_pool[rng.integers(0, len(ip_pool), size=idx.size)]
+            users[idx] = user_pool[rng.integers(0, len(user_pool), size=idx.size)]
+
+    # Status: normal 95% accepted, suspicious_geo 20% accepted, rest always fail
+    accept_prob = np.select([event_idx == 0, event_idx == 2], [0.95, 0.20], default=0.0)
+    statuses = np.where(rng.random(n) < accept_prob, 'Accepted', 'Failed')
+
+    pids = rng.integers(1000, 10000, size=n)
+    ports = rng.integers(40000, 60001, size=n)
+
+    if output_format == 'parquet':
+        # Columnar fast path: write the structured columns straight to
+        # Parquet — no text encoding, and the pipeline skips regex entirely
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        table = pa.table({
+            'timestamp': pa.array(timestamps, type=pa.timestamp('us')),
+            'source_ip': pa.array(ips),
+            'username': pa.array(users),
+            'status': pa.array(statuses),
+            'port': pa.array(ports, type=pa.uint16()),
+            'pid': pa.array(pids, type=pa.uint32())
+        })
+        pq.write_table(table, parquet_path, compression='zstd')
+
+        print(f"✓ Generated {num_entries} log entries in {parquet_path} (Parquet)")
+        print(f"  - Normal activity: ~70%")
+        print(f"  - Brute force patterns: ~15%")
+        print(f"  - Suspicious geographic access: ~10%")
+        print(f"  - Failed normal logins: ~5%")
+        return
+
+    # FIXED: Space-padded day format (e.g., "Jan  1" not "Jan 01")
+    # Format only the unique seconds, then fan back out by factorize codes —
+    # O(unique) strftime work instead of O(N) when timestamps repeat
+    ts_codes, ts_uniques = pd.factorize(timestamps)
+    uniq = pd.Series(pd.DatetimeIndex(ts_uniques))
+    months = pd.Series(uniq.dt.strftime('%b').to_numpy()[ts_codes])
+    days = pd.Series(uniq.dt.day.astype(str).str.rjust(2).to_numpy()[ts_codes])  # Space-padded
+    times = pd.Series(uniq.dt.strftime('%H:%M:%S').to_numpy()[ts_codes])
+
+    # Assemble all log lines with vectorized string concatenation
+    lines = (
+        months + ' ' + days + ' ' + times
+        + ' server sshd[' + pd.Series(pids.astype(str)) + ']: '
+        + pd.Series(statuses) + ' password for ' + pd.Series(users)
+        + ' from ' + pd.Series(ips)
+        + ' port ' + pd.Series(ports.astype(str)) + ' ssh2'
+    )
+
+    # Encode once and write one pre-joined blob in binary mode with a large
+    # buffer: one write() syscall instead of N trips through the default
+    # 8 KiB text buffer with per-call UTF-8 encoding
+    payload = ('\n'.join(lines) + '\n').encode('ascii')
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        f.write(payload)
+
+    # Parser-friendly TSV sidecar with the already-structured columns so the
+    # pipeline can skip regex parsing entirely when the generator is the source
+    sidecar_path = os.path.splitext(filepath)[0] + '.tsv'
+    iso_ts = timestamps.dt.strftime('%Y-%m-%dT%H:%M:%S')
+    tsv_lines = (
+        iso_ts + '\t' + pd.Series(ips) + '\t' + pd.Series(users)
+        + '\t' + pd.Series(statuses)
+        + '\t' + pd.Series(ports.astype(str)) + '\t' + pd.Series(pids.astype(str))
+    )
+    tsv_payload = (
+        'timestamp\tsource_ip\tusername\tstatus\tport\tpid\n'
+        + '\n'.join(tsv_lines) + '\n'
+    ).encode('ascii')
+    with open(sidecar_path, 'wb', buffering=1 << 20) as f:
+        f.write(tsv_payload)
+
     print(f"✓ Generated {num_entries} log entries in {filepath}")
+    print(f"✓ Wrote pre-parsed sidecar: {sidecar_path}")
     print(f"  - Normal activity: ~70%")
     print(f"  - Brute force patterns: ~15%")
     print(f"  - Suspicious geographic access: ~10%")
     print(f"  - Failed normal logins: ~5%")
     print(f"\nSample entries:")
-    
+
     # Show samples
     with open(filepath, 'r') as f:
         lines = f.readlines()
@@ -107,4 +176,6 @@ def generate_sample_logs(filename='ssh_auth.log', num_entries=5000, output_dir='
             print(f"  {lines[i].strip()}")
 
 if __name__ == "__main__":
-    generate_sample_logs()
+    import sys
+    fmt = 'parquet' if '--format=parquet' in sys.argv[1:] else 'log'
+    generate_sample_logs(output_format=fmt)
@@ -8,254 +8,394 @@ Fixed:
 - Proper geographic anomaly deduplication
 - Vectorized operations instead of iterrows
 - Realistic performance benchmarks
+
+Optimized:
+- Single shared per-IP aggregate pass feeding all IP-keyed detectors
 """
+import re
 import pandas as pd
 import numpy as np
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from datetime import timedelta
 
+# Numba is optional: when available the brute-force filter runs as one fused
+# parallel SIMD loop; otherwise a vectorized NumPy fallback is used
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _brute_force_mask(failed_count, duration_sec, threshold, window_sec):
+        """Fused rate/window brute-force filter over raw ndarrays"""
+        n = failed_count.shape[0]
+        mask = np.empty(n, dtype=np.bool_)
+        rate = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            d = duration_sec[i]
+            r = failed_count[i] if d == 0 else failed_count[i] * 3600.0 / d
+            rate[i] = r
+            mask[i] = (failed_count[i] >= threshold) or \
+                      ((r >= threshold / 2) and (d <= window_sec))
+        return mask, rate
+else:
+    def _brute_force_mask(failed_count, duration_sec, threshold, window_sec):
+        """Fused rate/window brute-force filter over raw ndarrays (NumPy fallback)"""
+        rate = np.where(duration_sec > 0,
+                        failed_count * 3600.0 / np.where(duration_sec > 0, duration_sec, 1),
+                        failed_count)
+        mask = (failed_count >= threshold) | \
+               ((rate >= threshold / 2) & (duration_sec <= window_sec))
+        return mask, rate
+
 class IntrusionDetector:
     """Detects various types of suspicious activity in authentication logs"""
-    
-    def __init__(self, 
+
+    # Known suspicious IP prefixes (simplified geolocation heuristic)
+    # Note: In production, use MaxMind GeoIP2 or similar database
+    _GEO_PREFIX_MAP = {
+        '45.': 'Eastern Europe',
+        '103.': 'Southeast Asia',
+        '185.': 'Europe/Tor',
+        '91.': 'Central Asia',
+        '196.': 'Africa',
+        '41.': 'Africa'
+    }
+
+    # One precompiled alternation: a single DFA pass over the column replaces
+    # a Python loop testing each prefix with startswith
+    _GEO_RE = re.compile(r'^(45|103|185|91|196|41)\.')
+
+    def __init__(self,
                  brute_force_threshold: int = 10,
-                 time_window_minutes: int = 60):
+                 time_window_minutes: int = 60,
+                 verbose: bool = True):
         """
         Initialize detector with thresholds
-        
+
         Args:
             brute_force_threshold: Min failed attempts to flag brute force
             time_window_minutes: Time window for clustering failed attempts
+            verbose: Print per-detector findings (disable for library use)
         """
         self.brute_force_threshold = brute_force_threshold
         self.time_window_minutes = time_window_minutes
+        self.verbose = verbose
         self.anomalies = []
-        
-    def detect_brute_force(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def _build_ip_profile(self, df: pd.DataFrame, presorted: bool = False) -> pd.DataFrame:
+        """
+        Build the shared per-IP aggregate consumed by the IP-keyed detectors
+
+        One sort plus one groupby.agg streams the DataFrame from RAM a single
+        time; brute force, geographic, and breach detection then slice columns
+        from this frame instead of each re-sorting and re-grouping the input.
+        Masked helper columns (timestamp/username where failed or successful)
+        let the conditional aggregates ride the same pass.
+
+        Args:
+            df: Transformed log DataFrame
+            presorted: Set True when df is already sorted by
+                       (source_ip, timestamp) to skip the internal sort
+        """
+        if presorted:
+            df_sorted = df
+        else:
+            df_sorted = df.sort_values(['source_ip', 'timestamp'], kind='mergesort')
+
+        if isinstance(df_sorted['source_ip'].dtype, pd.CategoricalDtype):
+            codes = df_sorted['source_ip'].cat.codes.to_numpy()
+        else:
+            codes, _ = pd.factorize(df_sorted['source_ip'])
+
+        if 'status_code' in df_sorted.columns:
+            # int8 compares: no boolean negation allocation for the success mask
+            failed = df_sorted['status_code'].eq(1)
+            success = df_sorted['status_code'].eq(0)
+        else:
+            failed = df_sorted['is_failed_login']
+            success = ~failed
+        ts = df_sorted['timestamp']
+
+        # Failures before the first success per IP: np.add.reduceat over the
+        # contiguous sorted groups — a direct vectorized reduce on uint8 lanes
+        cum_success = success.groupby(codes).cumsum()
+        pre_mask = (cum_success.to_numpy() == 0).view(np.uint8)
+        starts = np.r_[0, np.flatnonzero(np.diff(codes)) + 1]
+        pre_success = pd.Series(
+            np.add.reduceat(pre_mask, starts),
+            index=df_sorted['source_ip'].to_numpy()[starts]
+        )
+
+        work = pd.DataFrame({
+            'source_ip': df_sorted['source_ip'],
+            'is_internal_ip': df_sorted['is_internal_ip'],
+            'failed': failed,
+            'ts_failed': ts.where(failed),
+            'user_failed': df_sorted['username'].where(failed),
+            'ts_success': ts.where(success),
+            'user_success': df_sorted['username'].where(success)
+        })
+
+        profile = work.groupby('source_ip', observed=True).agg(
+            total_count=('failed', 'size'),
+            failed_count=('failed', 'sum'),
+            first_failed=('ts_failed', 'min'),
+            last_failed=('ts_failed', 'max'),
+            targeted_users=('user_failed', lambda x: tuple(x.dropna().unique())),
+            num_users_targeted=('user_failed', 'nunique'),
+            first_success_ts=('ts_success', 'min'),
+            first_success_user=('user_success', 'first'),
+            is_internal=('is_internal_ip', 'first')
+        )
+
+        profile['pre_success_failures'] = (
+            pre_success.reindex(profile.index).fillna(0).astype(int)
+        )
+
+        return profile
+
+    def detect_brute_force(self, df: pd.DataFrame,
+                           ip_profile: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Detect brute force attacks: multiple failed logins from same IP
-        
+
         FIXED: Now applies time_window_minutes for temporal clustering
-        
+
         Returns DataFrame of IPs with suspicious activity
         """
         if df.empty:
             return pd.DataFrame()
-        
-        failed_logins = df[df['is_failed_login']].copy()
-        
-        if failed_logins.empty:
+
+        if ip_profile is None:
+            ip_profile = self._build_ip_profile(df)
+
+        with_failures = ip_profile[ip_profile['failed_count'] > 0]
+
+        if with_failures.empty:
             return pd.DataFrame()
-        
-        # Group by IP and aggregate
-        grouped = failed_logins.groupby('source_ip').agg({
-            'timestamp': ['count', 'min', 'max'],
-            'username': lambda x: list(x.unique())
-        }).reset_index()
-        
-        grouped.columns = ['source_ip', 'failed_count', 'first_attempt', 
-                          'last_attempt', 'targeted_users']
-        
-        # Calculate duration and attempts per hour
-        grouped['duration_minutes'] = (
-            (grouped['last_attempt'] - grouped['first_attempt']).dt.total_seconds() / 60
-        )
-        
-        # FIXED: Apply time window filter - high rate within window
-        grouped['attempts_per_hour'] = np.where(
-            grouped['duration_minutes'] > 0,
-            grouped['failed_count'] / (grouped['duration_minutes'] / 60),
-            grouped['failed_count']
+
+        grouped = pd.DataFrame({
+            'source_ip': with_failures.index,
+            'failed_count': with_failures['failed_count'].to_numpy(),
+            'first_attempt': with_failures['first_failed'].to_numpy(),
+            'last_attempt': with_failures['last_failed'].to_numpy(),
+            'targeted_users': with_failures['targeted_users'].to_numpy(),
+            'num_users_targeted': with_failures['num_users_targeted'].to_numpy()
+        })
+
+        # FIXED: Apply time window filter - high rate within window.
+        # The rate computation and threshold/window mask run as one fused
+        # kernel over raw ndarrays (JIT-compiled when numba is installed)
+        # float32 is ample precision for counts and rates here and doubles
+        # the SIMD lanes per comparison in the kernel
+        failed_count = grouped['failed_count'].to_numpy().astype(np.float32)
+        # Raw int64 nanosecond subtraction instead of the per-element
+        # dt.total_seconds() datetime accessor
+        first_ns = grouped['first_attempt'].to_numpy().astype('datetime64[ns]').astype(np.int64)
+        last_ns = grouped['last_attempt'].to_numpy().astype('datetime64[ns]').astype(np.int64)
+        duration_sec = ((last_ns - first_ns) / 1e9).astype(np.float32)
+        mask, rate = _brute_force_mask(
+            failed_count,
+            duration_sec,
+            float(self.brute_force_threshold),
+            self.time_window_minutes * 60.0
         )
-        
+
+        grouped['duration_minutes'] = duration_sec / 60
+        grouped['attempts_per_hour'] = rate
+
         # Identify brute force: threshold met OR high rate within time window
-        brute_force = grouped[
-            (grouped['failed_count'] >= self.brute_force_threshold) |
-            ((grouped['attempts_per_hour'] >= self.brute_force_threshold / 2) & 
-             (grouped['duration_minutes'] <= self.time_window_minutes))
-        ].copy()
-        
+        # (no defensive copy needed — grouped is freshly built and
+        # copy-on-write protects the slice)
+        brute_force = grouped[mask]
+
         if brute_force.empty:
             return pd.DataFrame()
-        
-        # Severity classification
+
+        # Severity classification: searchsorted into the (25, 50] bin edges is
+        # one C-level binary search vs pd.cut's IntervalIndex machinery
         brute_force['anomaly_type'] = 'BRUTE_FORCE'
-        brute_force['severity'] = pd.cut(
-            brute_force['failed_count'],
-            bins=[0, 25, 50, float('inf')],
-            labels=['MEDIUM', 'HIGH', 'CRITICAL']
-        )
-        
-        brute_force['num_users_targeted'] = brute_force['targeted_users'].apply(len)
-        
-        if not brute_force.empty:
+        brute_force['severity'] = np.array(['MEDIUM', 'HIGH', 'CRITICAL'])[
+            np.searchsorted(np.array([25, 50]),
+                            brute_force['failed_count'].to_numpy(), side='left')
+        ]
+
+        if self.verbose:
             print(f"⚠ BRUTE FORCE DETECTED: {len(brute_force)} suspicious IPs")
-            for _, row in brute_force.head(5).iterrows():
-                print(f"  - {row['source_ip']}: {row['failed_count']} failed attempts "
-                      f"in {row['duration_minutes']:.1f} min "
-                      f"({row['attempts_per_hour']:.1f}/hr) [{row['severity']}]")
-        
+            # to_string is one C-level formatting call vs per-row iterrows boxing
+            print(brute_force.head(5)[
+                ['source_ip', 'failed_count', 'duration_minutes',
+                 'attempts_per_hour', 'severity']
+            ].to_string(index=False))
+
         return brute_force
-    
+
     def detect_unusual_usernames(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Detect attempts to access common vulnerable accounts
+
+        Note: keyed on (source_ip, username), so it keeps its own groupby
+        rather than sharing the per-IP profile
         """
         if df.empty:
             return pd.DataFrame()
-        
+
         vulnerable_accounts = [
-            'root', 'admin', 'test', 'oracle', 'postgres', 
+            'root', 'admin', 'test', 'oracle', 'postgres',
             'mysql', 'ubuntu', 'user', 'guest', 'ftp'
         ]
-        
-        suspicious_users = df[
-            df['username'].isin(vulnerable_accounts) & df['is_failed_login']
-        ].groupby(['source_ip', 'username']).agg({
+
+        # Project to the three needed columns before filtering so the slice
+        # doesn't drag the unused columns through memory
+        suspicious_users = df.loc[
+            df['username'].isin(vulnerable_accounts) & df['is_failed_login'],
+            ['source_ip', 'username', 'timestamp']
+        ].groupby(['source_ip', 'username'], observed=True).agg({
             'timestamp': 'count'
         }).reset_index()
-        
+
         suspicious_users.columns = ['source_ip', 'username', 'attempts']
-        
+
         suspicious_users = suspicious_users[suspicious_users['attempts'] >= 5]
-        
+
         if suspicious_users.empty:
             return pd.DataFrame()
-        
+
         suspicious_users['anomaly_type'] = 'VULNERABLE_ACCOUNT_TARGETING'
         suspicious_users['severity'] = np.where(
             suspicious_users['attempts'] > 20,
             'HIGH',
             'MEDIUM'
         )
-        
-        if not suspicious_users.empty:
+
+        if self.verbose:
             print(f"⚠ VULNERABLE ACCOUNT TARGETING: {len(suspicious_users)} patterns detected")
-            for _, row in suspicious_users.head(3).iterrows():
-                print(f"  - {row['source_ip']} → {row['username']}: {row['attempts']} attempts")
-        
+            print(suspicious_users.head(3)[
+                ['source_ip', 'username', 'attempts', 'severity']
+            ].to_string(index=False))
+
         return suspicious_users
-    
-    def detect_geographic_anomalies(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def detect_geographic_anomalies(self, df: pd.DataFrame,
+                                    ip_profile: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Detect access from unusual geographic locations
-        
-        FIXED: 
+
+        FIXED:
         - Deduplication of IPs
         - Clearer heuristic documentation
         - No false promises about API calls
         """
         if df.empty:
             return pd.DataFrame()
-        
-        # Get unique external IPs
-        external_ips = df[~df['is_internal_ip']]['source_ip'].unique()
-        
-        # Known suspicious IP prefixes (simplified geolocation heuristic)
-        # Note: In production, use MaxMind GeoIP2 or similar database
-        suspicious_ranges = {
-            '45.': 'Eastern Europe',
-            '103.': 'Southeast Asia',
-            '185.': 'Europe/Tor',
-            '91.': 'Central Asia',
-            '196.': 'Africa',
-            '41.': 'Africa'
-        }
-        
-        geo_anomalies = []
-        seen_ips = set()  # FIXED: Deduplication
-        
-        for ip in external_ips:
-            if ip in seen_ips:
-                continue
-                
-            for prefix, location in suspicious_ranges.items():
-                if ip.startswith(prefix):
-                    ip_logs = df[df['source_ip'] == ip]
-                    attempts = len(ip_logs)
-                    failed = len(ip_logs[ip_logs['is_failed_login']])
-                    
-                    geo_anomalies.append({
-                        'source_ip': ip,
-                        'location': location,
-                        'total_attempts': attempts,
-                        'failed_attempts': failed,
-                        'success_attempts': attempts - failed,
-                        'anomaly_type': 'GEOGRAPHIC_ANOMALY',
-                        'severity': 'HIGH' if failed > 10 else 'MEDIUM'
-                    })
-                    seen_ips.add(ip)
-                    break
-        
-        geo_df = pd.DataFrame(geo_anomalies)
-        
-        if not geo_df.empty:
+
+        if ip_profile is None:
+            ip_profile = self._build_ip_profile(df)
+
+        external = ip_profile[~ip_profile['is_internal']]
+
+        if external.empty:
+            return pd.DataFrame()
+
+        # Extract the suspicious prefix with one regex pass over the unique
+        # external IPs (dedup is implicit — one profile row per IP)
+        locations = (
+            external.index.to_series().astype('string')
+            .str.extract(self._GEO_RE, expand=False)
+            .add('.')
+            .map(self._GEO_PREFIX_MAP)
+        )
+        flagged = external[locations.notna().to_numpy()]
+
+        if flagged.empty:
+            return pd.DataFrame()
+
+        geo_df = pd.DataFrame({
+            'source_ip': flagged.index,
+            'location': locations.dropna().to_numpy(),
+            'total_attempts': flagged['total_count'].to_numpy(),
+            'failed_attempts': flagged['failed_count'].to_numpy()
+        })
+
+        geo_df['success_attempts'] = geo_df['total_attempts'] - geo_df['failed_attempts']
+        geo_df['anomaly_type'] = 'GEOGRAPHIC_ANOMALY'
+        geo_df['severity'] = np.where(geo_df['failed_attempts'] > 10, 'HIGH', 'MEDIUM')
+
+        if self.verbose:
             print(f"⚠ GEOGRAPHIC ANOMALIES: {len(geo_df)} unusual locations")
-            for _, row in geo_df.head(3).iterrows():
-                print(f"  - {row['source_ip']} ({row['location']}): "
-                      f"{row['failed_attempts']} failed, {row['success_attempts']} successful")
-        
+            print(geo_df.head(3)[
+                ['source_ip', 'location', 'failed_attempts', 'success_attempts']
+            ].to_string(index=False))
+
         return geo_df
-    
-    def detect_successful_after_many_failures(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def detect_successful_after_many_failures(self, df: pd.DataFrame,
+                                              ip_profile: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Detect IPs that had many failures followed by success (possible breach)
-        
+
         FIXED: Vectorized approach instead of iterrows for better performance
         """
         if df.empty:
             return pd.DataFrame()
-        
-        df_sorted = df.sort_values(['source_ip', 'timestamp']).copy()
-        
-        # Add cumulative success flag per IP
-        df_sorted['cumsum_success'] = (~df_sorted['is_failed_login']).groupby(
-            df_sorted['source_ip']
-        ).cumsum()
-        
-        # Count failures before first success
-        pre_success = df_sorted[df_sorted['cumsum_success'] == 0].groupby('source_ip').size()
-        
-        # Get first successful login per IP
-        successful_logins = df_sorted[~df_sorted['is_failed_login']].groupby('source_ip').first()
-        
-        # Merge data
-        breaches = []
-        for ip in pre_success.index:
-            failed_count = pre_success[ip]
-            if failed_count >= 5 and ip in successful_logins.index:
-                breach_info = successful_logins.loc[ip]
-                breaches.append({
-                    'source_ip': ip,
-                    'username': breach_info['username'],
-                    'failed_attempts_before_success': failed_count,
-                    'breach_timestamp': breach_info['timestamp'],
-                    'anomaly_type': 'POSSIBLE_BREACH',
-                    'severity': 'CRITICAL' if failed_count > 20 else 'HIGH'
-                })
-        
-        breach_df = pd.DataFrame(breaches)
-        
-        if not breach_df.empty:
+
+        if ip_profile is None:
+            ip_profile = self._build_ip_profile(df)
+
+        flagged = ip_profile[
+            (ip_profile['pre_success_failures'] >= 5) &
+            ip_profile['first_success_ts'].notna()
+        ]
+
+        if flagged.empty:
+            return pd.DataFrame()
+
+        failed_counts = flagged['pre_success_failures'].to_numpy()
+        breach_df = pd.DataFrame({
+            'source_ip': flagged.index,
+            'username': flagged['first_success_user'].to_numpy(),
+            'failed_attempts_before_success': failed_counts,
+            'breach_timestamp': flagged['first_success_ts'].to_numpy(),
+            'anomaly_type': 'POSSIBLE_BREACH',
+            'severity': np.where(failed_counts > 20, 'CRITICAL', 'HIGH')
+        })
+
+        if self.verbose:
             print(f"🚨 POSSIBLE BREACHES: {len(breach_df)} successful logins after many failures")
-            for _, row in breach_df.iterrows():
-                print(f"  - {row['source_ip']} → {row['username']}: "
-                      f"SUCCESS after {row['failed_attempts_before_success']} failures [{row['severity']}]")
-        
+            print(breach_df[
+                ['source_ip', 'username', 'failed_attempts_before_success', 'severity']
+            ].to_string(index=False))
+
         return breach_df
-    
-    def generate_full_report(self, df: pd.DataFrame) -> Dict:
+
+    # Below this row count, spawning workers costs more than it saves
+    _PARALLEL_THRESHOLD = 50_000
+
+    def generate_full_report(self, df: pd.DataFrame, parallel: bool = False) -> Dict:
         """
         Run all detection methods and generate comprehensive report
-        
+
+        Args:
+            df: Transformed log DataFrame
+            parallel: Overlap the (source_ip, username) groupby with the
+                      profile-based detectors on large inputs. The IP-keyed
+                      detectors share one fused aggregate pass, so that
+                      groupby is the only remaining independent work.
+
         Returns dict with all anomaly DataFrames and summary statistics
         """
-        print("\n" + "="*70)
-        print("INTRUSION DETECTION ANALYSIS")
-        print("="*70 + "\n")
-        
+        if self.verbose:
+            print("\n" + "="*70)
+            print("INTRUSION DETECTION ANALYSIS")
+            print("="*70 + "\n")
+
         if df.empty:
-            print("❌ No data to analyze")
+            if self.verbose:
+                print("❌ No data to analyze")
             return {
                 'brute_force_attacks': pd.DataFrame(),
                 'vulnerable_account_targeting': pd.DataFrame(),
@@ -263,20 +403,51 @@ class IntrusionDetector:
                 'possible_breaches': pd.DataFrame(),
                 'summary': {'total_anomalies': 0, 'critical_threats': 0}
             }
-        
-        # Run all detections
-        brute_force = self.detect_brute_force(df)
-        vulnerable = self.detect_unusual_usernames(df)
-        geo = self.detect_geographic_anomalies(df)
-        breaches = self.detect_successful_after_many_failures(df)
-        
+
+        # Categorical codes make the downstream groupbys hash int64 codes
+        # instead of full Python strings, and roughly halve column memory
+        df = df.assign(
+            source_ip=df['source_ip'].astype('category'),
+            username=df['username'].astype('category')
+        )
+
+        # Sort once up front — mergesort compares int64 category codes after
+        # the cast above — and reuse the sorted frame for the profile build
+        # instead of re-sorting inside each detector call. Only the columns
+        # the profile needs are carried through the sort.
+        profile_cols = ['source_ip', 'timestamp', 'username', 'is_failed_login',
+                        'is_internal_ip']
+        if 'status_code' in df.columns:
+            profile_cols.append('status_code')
+        df_sorted = df[profile_cols].sort_values(['source_ip', 'timestamp'],
+                                                 kind='mergesort')
+
+        # Build the shared per-IP aggregate once: one sort + one groupby pass
+        # over the data instead of one per detector
+        ip_profile = self._build_ip_profile(df_sorted, presorted=True)
+
+        # Run all detections. Threads suffice for the overlap — pandas
+        # releases the GIL in its groupby loops and nothing needs pickling
+        if parallel and len(df) > self._PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                vulnerable_future = executor.submit(self.detect_unusual_usernames, df)
+                brute_force = self.detect_brute_force(df, ip_profile)
+                geo = self.detect_geographic_anomalies(df, ip_profile)
+                breaches = self.detect_successful_after_many_failures(df, ip_profile)
+                vulnerable = vulnerable_future.result()
+        else:
+            brute_force = self.detect_brute_force(df, ip_profile)
+            vulnerable = self.detect_unusual_usernames(df)
+            geo = self.detect_geographic_anomalies(df, ip_profile)
+            breaches = self.detect_successful_after_many_failures(df, ip_profile)
+
         # Calculate summary
         total_anomalies = len(brute_force) + len(vulnerable) + len(geo) + len(breaches)
-        
+
         critical_count = len(breaches)
         if not brute_force.empty:
             critical_count += len(brute_force[brute_force['severity'] == 'CRITICAL'])
-        
+
         report = {
             'brute_force_attacks': brute_force,
             'vulnerable_account_targeting': vulnerable,
@@ -291,18 +462,19 @@ class IntrusionDetector:
                 'breach_count': len(breaches)
             }
         }
-        
-        print(f"\n{'='*70}")
-        print("📊 DETECTION SUMMARY")
-        print(f"{'='*70}")
-        print(f"  Total anomalies detected: {total_anomalies}")
-        print(f"  Critical threats: {critical_count}")
-        print(f"  - Brute force attacks: {len(brute_force)}")
-        print(f"  - Vulnerable accounts targeted: {len(vulnerable)}")
-        print(f"  - Geographic anomalies: {len(geo)}")
-        print(f"  - Possible breaches: {len(breaches)}")
-        print(f"{'='*70}\n")
-        
+
+        if self.verbose:
+            print(f"\n{'='*70}")
+            print("📊 DETECTION SUMMARY")
+            print(f"{'='*70}")
+            print(f"  Total anomalies detected: {total_anomalies}")
+            print(f"  Critical threats: {critical_count}")
+            print(f"  - Brute force attacks: {len(brute_force)}")
+            print(f"  - Vulnerable accounts targeted: {len(vulnerable)}")
+            print(f"  - Geographic anomalies: {len(geo)}")
+            print(f"  - Possible breaches: {len(breaches)}")
+            print(f"{'='*70}\n")
+
         return report
 
 if __name__ == "__main__":
@@ -315,8 +487,8 @@ if __name__ == "__main__":
         'is_failed_login': [True] * 95 + [False] * 5,
         'is_internal_ip': [False] * 100
     })
-    
+
     detector = IntrusionDetector(brute_force_threshold=10, time_window_minutes=60)
     report = detector.generate_full_report(sample_data)
-    
+
     print(f"\nTest completed. Found {report['summary']['total_anomalies']} anomalies.")
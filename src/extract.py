@@ -7,13 +7,20 @@ Fixed:
 - Memory-efficient streaming option
 - Better error messages
 """
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from typing import List, Generator
 from pathlib import Path
 
 class LogExtractor:
     """Handles extraction of raw log files from source directories"""
-    
+
+    # Files larger than this are read via mmap: the kernel page cache serves
+    # pages on demand instead of copying through a userspace read buffer
+    MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
     def __init__(self, log_directory: str = None):
         """
         Initialize extractor with log directory
@@ -62,42 +69,130 @@ class LogExtractor:
         print(f"✓ Extracted {len(logs):,} log entries from {filename}")
         return logs
     
+    def extract_logs_chunked(self, filename: str,
+                             chunk_size: int = 100_000) -> Generator[List[str], None, None]:
+        """
+        Stream log entries in bounded batches (memory-efficient extract)
+
+        Peak memory stays O(chunk_size) raw lines instead of the whole
+        file, which matters once logs outgrow RAM.
+
+        Args:
+            filename: Name of the log file to extract
+            chunk_size: Maximum lines per yielded batch
+
+        Yields:
+            Lists of at most chunk_size log lines
+
+        Raises:
+            FileNotFoundError: If log file doesn't exist
+        """
+        filepath = self.log_directory / filename
+
+        if not filepath.exists():
+            raise FileNotFoundError(
+                f"Log file not found: {filepath}\n"
+                f"Current directory: {os.getcwd()}\n"
+                f"Looking in: {self.log_directory}"
+            )
+
+        total = 0
+        with open(filepath, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = list(islice(f, chunk_size))
+                if not chunk:
+                    break
+                total += len(chunk)
+                yield chunk
+
+        print(f"✓ Extracted {total:,} log entries from {filename} (streamed)")
+
     def extract_logs_streaming(self, filename: str) -> Generator[str, None, None]:
         """
         Extract logs using generator for memory efficiency (large files)
-        
+
+        Lines are yielded raw — the transformer's regex search tolerates the
+        trailing newline, so stripping here would just be an extra string
+        allocation per line.
+
         Args:
             filename: Name of the log file
-            
+
         Yields:
             Individual log lines
         """
         filepath = self.log_directory / filename
-        
+
         if not filepath.exists():
             raise FileNotFoundError(f"Log file not found: {filepath}")
-        
+
+        # OPTIMIZED: Big files go through mmap — page-cache backed, no
+        # userspace buffer copy per read() call
+        if filepath.stat().st_size > self.MMAP_THRESHOLD_BYTES:
+            yield from self.extract_logs_mmap(filename)
+            return
+
         with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                yield line.strip()
-    
+            yield from f
+
+    def extract_logs_mmap(self, filename: str) -> Generator[str, None, None]:
+        """
+        Extract logs by memory-mapping the file (large-file fast path)
+
+        The mapping is read-only (ACCESS_READ) and, where the platform
+        supports it, advised as MADV_SEQUENTIAL so the kernel reads ahead
+        aggressively and drops pages behind the cursor. Lines are yielded
+        with their trailing newline, same as extract_logs_streaming.
+
+        Caveat: if another process truncates the file while it is mapped,
+        touching pages past the new end raises SIGBUS — acceptable here
+        since the pipeline reads logs that are rotated, not truncated.
+
+        Args:
+            filename: Name of the log file
+
+        Yields:
+            Individual log lines
+        """
+        filepath = self.log_directory / filename
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"Log file not found: {filepath}")
+
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):  # POSIX only
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                for line in iter(mm.readline, b''):
+                    yield line.decode('utf-8', 'replace')
+
     def extract_multiple_logs(self, filenames: List[str]) -> List[str]:
         """
         Extract from multiple log files and combine
-        
+
+        OPTIMIZED: Files are read concurrently — the GIL is released
+        during file I/O, so a small thread pool overlaps disk latency
+        instead of waiting on each file in turn. Results keep the order
+        of the filenames argument.
+
         Args:
             filenames: List of log filenames
-            
+
         Returns:
             Combined list of all log lines
         """
-        all_logs = []
-        for filename in filenames:
+        def read_one(filename: str) -> List[str]:
             try:
-                all_logs.extend(self.extract_logs(filename))
+                return self.extract_logs(filename)
             except FileNotFoundError as e:
                 print(f"⚠ Skipping {filename}: {e}")
-        
+                return []
+
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(filenames)))) as pool:
+            results = list(pool.map(read_one, filenames))
+
+        all_logs = list(chain.from_iterable(results))
+
         print(f"✓ Total extracted: {len(all_logs):,} entries from {len(filenames)} files")
         return all_logs
     
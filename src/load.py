@@ -7,6 +7,7 @@ Fixed:
 - Empty DataFrame validation
 - Relative path handling
 """
+import numpy as np
 import pandas as pd
 import os
 from datetime import datetime
@@ -14,7 +15,12 @@ from pathlib import Path
 
 class DataLoader:
     """Handles loading of processed data to various storage formats"""
-    
+
+    # Frames at least this large are written as a date-partitioned dataset
+    # instead of one monolithic Parquet file, so day-filtered scans prune
+    # whole partitions; small frames keep the cheaper single-file layout
+    PARTITION_THRESHOLD_ROWS = 1_000_000
+
     def __init__(self, output_directory: str = None):
         """
         Initialize loader with output directory
@@ -31,31 +37,65 @@ class DataLoader:
         self.output_directory = Path(output_directory)
         self.output_directory.mkdir(parents=True, exist_ok=True)
         
-    def load_to_csv(self, df: pd.DataFrame, filename: str = None) -> str:
+    def load_to_csv(self, df: pd.DataFrame, filename: str = None,
+                    compression: str = None) -> str:
         """
         Load DataFrame to CSV file
-        
+
         Args:
             df: Processed DataFrame
             filename: Output filename (auto-generated if None)
-            
+            compression: 'gzip' to stream through an Arrow
+                         CompressedOutputStream (appends .gz), None for
+                         plain text
+
         Returns:
             Path to saved file
-            
+
         Raises:
             ValueError: If DataFrame is empty
         """
         # FIXED: Validate DataFrame before saving
         if df is None or df.empty:
             raise ValueError("Cannot save empty DataFrame to CSV")
-        
+
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'processed_logs_{timestamp}.csv'
-        
+
+        if compression == 'gzip' and not filename.endswith('.gz'):
+            filename += '.gz'
+
         filepath = self.output_directory / filename
-        df.to_csv(filepath, index=False)
-        
+
+        # OPTIMIZED: Arrow's C++ CSV writer formats rows multithreaded,
+        # replacing the Python-level row formatter in DataFrame.to_csv
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            df.to_csv(filepath, index=False, compression=compression)
+        else:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if compression == 'gzip':
+                    # Format and gzip in one C++ pass — no uncompressed
+                    # intermediate on disk, and the codec overlaps with
+                    # write I/O
+                    with pa.CompressedOutputStream(str(filepath), 'gzip') as out, \
+                            pacsv.CSVWriter(out, table.schema) as writer:
+                        writer.write_table(table)
+                else:
+                    pacsv.write_csv(
+                        table, str(filepath),
+                        write_options=pacsv.WriteOptions(include_header=True)
+                    )
+            except (ValueError, NotImplementedError):
+                # Arrow's CSV writer rejects nested columns (e.g. the
+                # tuple-valued targeted_users in anomaly reports) — those
+                # small frames go through pandas instead
+                df.to_csv(filepath, index=False, compression=compression)
+
         file_size_kb = filepath.stat().st_size / 1024
         
         print(f"✓ Loaded {len(df):,} records to {filepath}")
@@ -66,27 +106,67 @@ class DataLoader:
     def load_to_parquet(self, df: pd.DataFrame, filename: str = None) -> str:
         """
         Load DataFrame to Parquet file (more efficient for large datasets)
-        
+
         FIXED: Proper error handling for missing parquet engine
+
+        Note: no defensive copy or datetime re-cast happens here — pandas
+        datetime64 columns map natively to Arrow timestamps, so the frame
+        is written as-is (modulo the categorical overlay below).
         """
         # FIXED: Validate DataFrame
         if df is None or df.empty:
             raise ValueError("Cannot save empty DataFrame to Parquet")
-        
+
+        # Large event frames go out date-partitioned for partition pruning
+        if 'date' in df.columns and len(df) >= self.PARTITION_THRESHOLD_ROWS:
+            return self.load_to_parquet_dataset(df)
+
         try:
             if filename is None:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f'processed_logs_{timestamp}.parquet'
             
             filepath = self.output_directory / filename
-            
-            # Convert datetime columns to ensure compatibility
-            df_copy = df.copy()
-            for col in df_copy.select_dtypes(include=['datetime64']).columns:
-                df_copy[col] = pd.to_datetime(df_copy[col])
-            
-            df_copy.to_parquet(filepath, index=False, engine='pyarrow')
-            
+
+            # OPTIMIZED: Dictionary-encode low-cardinality string columns so
+            # Parquet writes compact dictionary pages. assign is a shallow
+            # copy-on-write overlay — no full materialization of the frame
+            # (datetime64 columns map to Arrow timestamps as-is, so the old
+            # df.copy() + re-to_datetime pass was pure overhead)
+            cat_cols = {
+                col: df[col].astype('category')
+                for col in ('status', 'username', 'weekday_name')
+                if col in df.columns
+                and not isinstance(df[col].dtype, pd.CategoricalDtype)
+            }
+            if cat_cols:
+                df = df.assign(**cat_cols)
+
+            # OPTIMIZED: Sort event frames by (timestamp, source_ip) so the
+            # row-group min/max statistics are tight — time-window and IP
+            # predicates can then skip whole row-groups on read. Row groups
+            # aim for roughly one hour of events each. Anomaly frames have
+            # no timestamp column and keep their report ordering.
+            row_group_size = max(64_000, len(df) // 8)
+            if 'timestamp' in df.columns:
+                sort_cols = ['timestamp'] + (
+                    ['source_ip'] if 'source_ip' in df.columns else []
+                )
+                df = df.sort_values(sort_cols, kind='mergesort', ignore_index=True)
+                span_h = (
+                    df['timestamp'].iloc[-1] - df['timestamp'].iloc[0]
+                ).total_seconds() / 3600
+                if span_h > 1:
+                    row_group_size = max(8_192, int(len(df) / span_h))
+
+            df.to_parquet(
+                filepath, index=False, engine='pyarrow',
+                compression='zstd', compression_level=3,
+                row_group_size=row_group_size,
+                use_dictionary=True, data_page_size=1 << 20,
+                write_statistics=True
+            )
+
             file_size_kb = filepath.stat().st_size / 1024
             
             print(f"✓ Loaded {len(df):,} records to {filepath} (Parquet format)")
@@ -99,6 +179,50 @@ class DataLoader:
             print("  Falling back to CSV format...")
             return self.load_to_csv(df, filename.replace('.parquet', '.csv'))
     
+    def load_to_parquet_dataset(self, df: pd.DataFrame,
+                                dataset_name: str = 'parquet_dataset') -> str:
+        """
+        Write a date-partitioned Parquet dataset (hive directory layout)
+
+        Each day lands in its own date=YYYY-MM-DD/ directory, so
+        downstream day-filtered scans read only the matching partitions
+        instead of the whole output.
+
+        Args:
+            df: Processed DataFrame with a 'date' column
+            dataset_name: Directory name under the output directory
+
+        Returns:
+            Path to the dataset base directory
+        """
+        if df is None or df.empty:
+            raise ValueError("Cannot save empty DataFrame to Parquet")
+
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        base_dir = self.output_directory / dataset_name
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        date_idx = table.schema.get_field_index('date')
+        table = table.set_column(
+            date_idx, 'date', table.column('date').cast(pa.date32())
+        )
+
+        ds.write_dataset(
+            table, base_dir=str(base_dir), format='parquet',
+            partitioning=ds.partitioning(
+                pa.schema([('date', pa.date32())]), flavor='hive'
+            ),
+            existing_data_behavior='overwrite_or_ignore'
+        )
+
+        n_parts = len(list(base_dir.glob('date=*')))
+        print(f"✓ Loaded {len(df):,} records to {base_dir} "
+              f"({n_parts} date partitions)")
+
+        return str(base_dir)
+
     def create_summary_stats(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Generate summary statistics for the processed data
@@ -118,44 +242,65 @@ class DataLoader:
                 'error': 'No data to analyze'
             }])
         
+        # OPTIMIZED: Pull the underlying arrays once and compute every stat
+        # from them — one pass per column instead of separate
+        # nunique/sum/mean/min/max walks over the frame. pd.unique skips
+        # the counting that nunique does on top of hashing.
+        failed = df['is_failed_login'].to_numpy()
+        internal = df['is_internal_ip'].to_numpy()
+        ts = df['timestamp'].to_numpy()
+        ts_min, ts_max = ts.min(), ts.max()
+
         summary = {
             'total_logs': len(df),
-            'unique_ips': df['source_ip'].nunique(),
-            'unique_users': df['username'].nunique(),
-            'failed_logins': int(df['is_failed_login'].sum()),
-            'success_rate': round((1 - df['is_failed_login'].mean()) * 100, 2),
-            'internal_traffic_pct': round(df['is_internal_ip'].mean() * 100, 2),
-            'date_range_start': df['timestamp'].min(),
-            'date_range_end': df['timestamp'].max(),
-            'time_span_hours': round((df['timestamp'].max() - df['timestamp'].min()).total_seconds() / 3600, 2)
+            'unique_ips': len(pd.unique(df['source_ip'])),
+            'unique_users': len(pd.unique(df['username'])),
+            'failed_logins': int(failed.sum()),
+            'success_rate': round((1 - failed.mean()) * 100, 2),
+            'internal_traffic_pct': round(internal.mean() * 100, 2),
+            'date_range_start': pd.Timestamp(ts_min),
+            'date_range_end': pd.Timestamp(ts_max),
+            'time_span_hours': round(
+                (ts_max - ts_min) / np.timedelta64(1, 'h'), 2
+            )
         }
-        
+
         return pd.DataFrame([summary])
     
-    def load_anomalies(self, anomaly_dict: dict) -> dict:
+    def load_anomalies(self, anomaly_dict: dict, format: str = 'parquet') -> dict:
         """
         Save all anomaly reports to separate files
-        
+
+        Parquet is the default sink: downstream reads get typed columnar
+        scans instead of re-paying the CSV parse on every load. Pass
+        format='csv' when a consumer needs plain text.
+
         Args:
             anomaly_dict: Dictionary containing anomaly DataFrames
-            
+            format: 'parquet' (default) or 'csv'
+
         Returns:
             Dictionary of saved file paths
         """
         saved_files = {}
-        
+
         anomaly_types = {
-            'brute_force_attacks': 'anomaly_brute_force.csv',
-            'vulnerable_account_targeting': 'anomaly_vulnerable_accounts.csv',
-            'geographic_anomalies': 'anomaly_geographic.csv',
-            'possible_breaches': 'anomaly_breaches.csv'
+            'brute_force_attacks': 'anomaly_brute_force',
+            'vulnerable_account_targeting': 'anomaly_vulnerable_accounts',
+            'geographic_anomalies': 'anomaly_geographic',
+            'possible_breaches': 'anomaly_breaches'
         }
-        
-        for key, filename in anomaly_types.items():
+
+        for key, stem in anomaly_types.items():
             if key in anomaly_dict and not anomaly_dict[key].empty:
-                filepath = self.load_to_csv(anomaly_dict[key], filename)
+                if format == 'parquet':
+                    filepath = self.load_to_parquet(
+                        anomaly_dict[key], f'{stem}.parquet'
+                    )
+                else:
+                    filepath = self.load_to_csv(anomaly_dict[key], f'{stem}.csv')
                 saved_files[key] = filepath
-        
+
         return saved_files
 
 if __name__ == "__main__":
@@ -9,10 +9,56 @@ Fixed:
 - Failed parsing samples for debugging
 - Timezone awareness option
 """
+import mmap
+import os
 import re
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+# Numba is optional: when available the scalar IP helpers below compile to
+# native code for online per-line classification; the plain Python
+# definitions double as the fallback
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+def _parse_ipv4(ip: str) -> int:
+    """Pack a dotted-quad string into a uint32 value; 0 on malformed input"""
+    value = 0
+    octet = 0
+    dots = 0
+    for ch in ip:
+        if ch == '.':
+            if octet > 255:
+                return 0
+            value = (value << 8) | octet
+            octet = 0
+            dots += 1
+        else:
+            d = ord(ch) - 48
+            if d < 0 or d > 9:
+                return 0
+            octet = octet * 10 + d
+    if dots != 3 or octet > 255:
+        return 0
+    return (value << 8) | octet
+
+def _is_internal_ip_u32(ip: int) -> bool:
+    """RFC1918 check on one packed uint32 address — three mask compares"""
+    return (((ip & 0xFF000000) == 0x0A000000)
+            or ((ip & 0xFFF00000) == 0xAC100000)
+            or ((ip & 0xFFFF0000) == 0xC0A80000))
+
+if _HAS_NUMBA:
+    _parse_ipv4 = njit(cache=True)(_parse_ipv4)
+    _is_internal_ip_u32 = njit(cache=True, inline='always')(_is_internal_ip_u32)
 
 class LogTransformer:
     """Handles parsing and transformation of SSH authentication logs"""
@@ -23,7 +69,20 @@ class LogTransformer:
         r'(Accepted|Failed)\s+password\s+for\s+([\w\.\-_]+)\s+from\s+'
         r'([\d\.]+)\s+port\s+(\d+)'
     )
-    
+
+    # Bytes twin of LOG_PATTERN for matching directly over mmap buffers:
+    # finditer runs as one C-level scan with no per-line str decode
+    LOG_PATTERN_BYTES = re.compile(
+        rb'(\w+)\s+(\d+)\s+(\d+:\d+:\d+)\s+\w+\s+sshd\[(\d+)\]:\s+'
+        rb'(Accepted|Failed)\s+password\s+for\s+([\w\.\-_]+)\s+from\s+'
+        rb'([\d\.]+)\s+port\s+(\d+)'
+    )
+
+    # Syslog month abbreviations — direct lookup replaces strptime's
+    # format-string machinery in the per-line fallback path
+    _MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+               'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
     def __init__(self, year: Optional[int] = None):
         """
         Initialize transformer
@@ -35,7 +94,21 @@ class LogTransformer:
         self.failed_count = 0
         self.failed_samples = []  # FIXED: Store samples of failed parses
         self.year = year or datetime.now().year
-        
+
+        # Memoize timestamp construction per instance: log timestamps repeat
+        # heavily (many events per second), so most lines hit the cache
+        self._build_timestamp = lru_cache(maxsize=8192)(self._build_timestamp_uncached)
+
+    def _build_timestamp_uncached(self, month: str, day: str, time: str) -> datetime:
+        """Construct a datetime directly from syslog fields
+
+        A dict lookup plus one split is 5-10x cheaper per call than
+        strptime, which reparses its format string every time.
+        """
+        h, m, s = time.split(':')
+        return datetime(self.year, self._MONTHS[month], int(day),
+                        int(h), int(m), int(s))
+
     def parse_log_line(self, log_line: str) -> Optional[Dict]:
         """
         Parse a single SSH log line into structured data
@@ -54,10 +127,10 @@ class LogTransformer:
         month, day, time, pid, status, username, ip, port = match.groups()
         
         try:
-            # Convert to timestamp
-            timestamp_str = f"{self.year} {month} {day} {time}"
-            timestamp = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
-            
+            # Convert to timestamp (memoized month-table construction
+            # instead of strptime)
+            timestamp = self._build_timestamp(month, day, time)
+
             return {
                 'timestamp': timestamp,
                 'status': status,
@@ -66,7 +139,7 @@ class LogTransformer:
                 'port': int(port),
                 'pid': int(pid)
             }
-        except (ValueError, AttributeError) as e:
+        except (KeyError, ValueError, AttributeError) as e:
             if self.failed_count < 5:
                 self.failed_samples.append(f"{log_line.strip()} [Error: {e}]")
             return None
@@ -93,53 +166,427 @@ class LogTransformer:
         
         return False
     
-    def transform_logs(self, raw_logs: List[str]) -> pd.DataFrame:
+    @staticmethod
+    def _pack_ipv4(ips: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Transform raw log lines into structured DataFrame
-        
+        Pack a dotted-quad column into uint32 values plus a validity mask
+
+        Rows that do not split into exactly four octets in 0-255 pack to
+        0 with valid=False — per row, since split(expand=True) sizes its
+        output to the widest value in the column and out-of-range octets
+        would otherwise wrap into private space under the uint32 cast.
+        """
+        octets = ips.astype('string').str.split('.', expand=True)
+        if octets.shape[1] < 4:
+            return np.zeros(len(ips), dtype=np.uint32), np.zeros(len(ips), dtype=bool)
+
+        oct_num = octets.iloc[:, :4].apply(
+            pd.to_numeric, errors='coerce'
+        ).to_numpy(dtype=np.float64)
+        valid = (
+            ~np.isnan(oct_num).any(axis=1)
+            & (oct_num >= 0).all(axis=1)
+            & (oct_num <= 255).all(axis=1)
+        )
+        if octets.shape[1] > 4:
+            # Only the rows that actually have a fifth field are malformed
+            valid &= octets.iloc[:, 4:].isna().all(axis=1).to_numpy()
+
+        ip32 = np.zeros(len(ips), dtype=np.uint32)
+        vals = oct_num[valid].astype(np.uint32)
+        ip32[valid] = (vals[:, 0] << 24) | (vals[:, 1] << 16) | (vals[:, 2] << 8) | vals[:, 3]
+        return ip32, valid
+
+    @staticmethod
+    def _rfc1918_mask(ip32: np.ndarray) -> np.ndarray:
+        """Three bitmask compares covering the private RFC1918 ranges"""
+        return (
+            ((ip32 & 0xFF000000) == 0x0A000000) |   # 10.0.0.0/8
+            ((ip32 & 0xFFF00000) == 0xAC100000) |   # 172.16.0.0/12
+            ((ip32 & 0xFFFF0000) == 0xC0A80000)     # 192.168.0.0/16
+        )
+
+    @staticmethod
+    def _vec_internal_ip(ips: pd.Series) -> np.ndarray:
+        """
+        Vectorized RFC1918 check over a whole column
+
+        Packs each dotted quad into a uint32 and tests the three private
+        ranges with bitmask compares — four integer comparisons on a
+        contiguous array instead of one Python call per row. Rows that do
+        not split into four numeric octets come back False.
+        """
+        ip32, valid = LogTransformer._pack_ipv4(ips)
+        return LogTransformer._rfc1918_mask(ip32) & valid
+
+    def _add_derived_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Attach derived analysis columns shared by all transform paths"""
+        # Arrow-backed strings: contiguous buffers with SIMD C++ kernels for
+        # the isin/startswith/groupby work downstream, at ~half the memory of
+        # object-dtype Python strings
+        for col in ('status', 'username', 'source_ip'):
+            df[col] = df[col].astype('string[pyarrow]')
+
+        # Compute every derived column as a plain NumPy array first, then
+        # attach them in a single assign — one BlockManager update instead
+        # of per-column consolidation churn. Hour/day fall out of integer
+        # datetime64 arithmetic and fit in int8.
+        ts64 = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        hour = (ts64.astype('datetime64[h]').astype(np.int64) % 24).astype(np.int8)
+        # Epoch day 0 (1970-01-01) was a Thursday = 3 in Monday=0 numbering
+        dow = ((ts64.astype('datetime64[D]').astype(np.int64) + 3) % 7).astype(np.int8)
+
+        # Single int8 code (0=Accepted, 1=Failed) drives downstream
+        # failed/success checks as one-byte SIMD compares; is_failed_login is
+        # kept for the CSV schema and notebook consumers, and status shrinks
+        # to a two-category Categorical. weekday_name is likewise a
+        # 7-category Categorical — dictionary-encoded in memory and Parquet.
+        status_code = (df['status'] == 'Failed').to_numpy().astype(np.int8)
+
+        # FIXED: Use the improved internal IP detection, and classify only
+        # the unique addresses — attack traffic concentrates in a handful
+        # of IPs, so the uint32 range check runs O(unique) and fans back
+        # out through the factorize codes. The packed value is kept as
+        # source_ip_u32 so downstream range predicates skip re-parsing.
+        ip_codes, ip_uniques = pd.factorize(df['source_ip'])
+        ip32_uniq, ip_valid = self._pack_ipv4(pd.Series(ip_uniques))
+        is_internal = (self._rfc1918_mask(ip32_uniq) & ip_valid)[ip_codes]
+        source_ip_u32 = ip32_uniq[ip_codes]
+
+        return df.assign(
+            status=df['status'].astype('category'),
+            status_code=status_code,
+            is_failed_login=status_code == 1,
+            hour_of_day=hour,
+            day_of_week=dow,
+            is_internal_ip=is_internal,
+            source_ip_u32=source_ip_u32,
+            date=df['timestamp'].dt.date,
+            weekday_name=df['timestamp'].dt.day_name().astype('category')
+        )
+
+    def transform_sidecar(self, filepath) -> pd.DataFrame:
+        """
+        Fast path: load a pre-parsed TSV sidecar written by generate_logs.py
+
+        Skips regex parsing entirely — a single C-level read_csv pass
+        instead of per-line pattern matching.
+
         Args:
-            raw_logs: List of raw log line strings
-            
+            filepath: Path to the .tsv sidecar file
+
         Returns:
-            Pandas DataFrame with parsed log data
+            Pandas DataFrame with the same schema as transform_logs
         """
-        parsed_logs = []
-        
+        df = pd.read_csv(
+            filepath,
+            sep='\t',
+            engine='c',
+            dtype={'source_ip': 'string[pyarrow]', 'username': 'string[pyarrow]',
+                   'status': 'string[pyarrow]', 'port': np.uint16, 'pid': np.uint32},
+            parse_dates=['timestamp']
+        )
+
+        self.parsed_count = len(df)
+
+        print(f"✓ Loaded {len(df):,} pre-parsed entries from sidecar")
+        print(f"  ✓ Regex parsing skipped (generator-provided TSV)")
+
+        return self._add_derived_columns(df)
+
+    def transform_parquet(self, filepath) -> pd.DataFrame:
+        """
+        Fast path: load a Parquet source written by generate_logs.py
+
+        A columnar read skips both text decoding and regex parsing.
+
+        Args:
+            filepath: Path to the .parquet source file
+
+        Returns:
+            Pandas DataFrame with the same schema as transform_logs
+        """
+        df = pd.read_parquet(filepath, engine='pyarrow')
+
+        self.parsed_count = len(df)
+
+        print(f"✓ Loaded {len(df):,} entries from Parquet source")
+        print(f"  ✓ Text decode and regex parsing skipped (columnar source)")
+
+        return self._add_derived_columns(df)
+
+    def _extract_batch(self, raw_logs: List[str]) -> pd.DataFrame:
+        """
+        Vectorized parse of a batch of raw lines
+
+        One str.extract pass pulls all 8 capture groups as columns at once,
+        and one pd.to_datetime(cache=True) call parses the timestamps —
+        repeated month/day/second strings in logs are memoized. This keeps
+        the per-row work in C instead of N Python-level regex/strptime calls.
+        """
+        s = pd.Series(raw_logs, dtype='string[pyarrow]')
+        parts = s.str.extract(self.LOG_PATTERN)
+        mask = parts[0].notna()
+
+        n_failed = int((~mask).sum())
+        if n_failed and len(self.failed_samples) < 5:
+            # FIXED: Store failed samples for debugging
+            self.failed_samples.extend(
+                s[~mask].str.strip().head(5 - len(self.failed_samples)).tolist()
+            )
+        self.parsed_count += len(s) - n_failed
+        self.failed_count += n_failed
+
+        parts = parts[mask]
+        if parts.empty:
+            return pd.DataFrame()
+
+        parts.columns = ['month', 'day', 'time', 'pid', 'status',
+                         'username', 'source_ip', 'port']
+
+        ts_strs = (str(self.year) + ' ' + parts['month'] + ' '
+                   + parts['day'] + ' ' + parts['time'])
+        timestamps = self._parse_timestamps(ts_strs)
+
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'status': parts['status'],
+            'username': parts['username'],
+            'source_ip': parts['source_ip'],
+            # Fixed uint16/uint32 rather than downcast='unsigned': downcast
+            # picks the narrowest type the batch happens to need, which
+            # made the output schema vary run to run and between paths
+            'port': pd.to_numeric(parts['port']).astype(np.uint16),
+            'pid': pd.to_numeric(parts['pid']).astype(np.uint32)
+        }).reset_index(drop=True)
+
+        # Pattern matches with an impossible date came back NaT — drop
+        # them and account for them like any other failed parse
+        bad = df['timestamp'].isna()
+        if bad.any():
+            n_bad = int(bad.sum())
+            if len(self.failed_samples) < 5:
+                self.failed_samples.extend(
+                    s[mask][np.asarray(bad)].str.strip()
+                    .head(5 - len(self.failed_samples)).tolist()
+                )
+            self.parsed_count -= n_bad
+            self.failed_count += n_bad
+            df = df[~bad].reset_index(drop=True)
+
+        return df
+
+    def transform_mmap(self, mm) -> pd.DataFrame:
+        """
+        Zero-copy parse of a whole mapped log file
+
+        Runs LOG_PATTERN_BYTES.finditer directly over the mmap buffer: one
+        C-level scan of the mapped pages, no per-line decode, no
+        intermediate list of line strings. Fields stay as bytes until final
+        DataFrame construction, where each column is decoded once.
+
+        Args:
+            mm: An mmap object (or any bytes-like buffer) over the log file
+
+        Returns:
+            Pandas DataFrame with the same schema as transform_logs
+        """
+        months, days, times, pids = [], [], [], []
+        statuses, usernames, ips, ports = [], [], [], []
+        columns = (months, days, times, pids, statuses, usernames, ips, ports)
+
+        for m in self.LOG_PATTERN_BYTES.finditer(mm):
+            for col, val in zip(columns, m.groups()):
+                col.append(val)
+
+        # Line accounting without materializing lines: newline count via a
+        # zero-copy uint8 view of the buffer
+        total_lines = int((np.frombuffer(mm, dtype=np.uint8) == 0x0A).sum())
+        matched = len(months)
+        self.parsed_count += matched
+        self.failed_count += max(total_lines, matched) - matched
+
+        if not matched:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        df = self._frame_from_byte_fields(columns)
+        if df.empty:
+            self._report_parse_failure()
+            return df
+        df = self._add_derived_columns(df)
+        self._report_parse_summary()
+        return df
+
+    @staticmethod
+    def _parse_timestamps(ts_strs: pd.Series) -> pd.DatetimeIndex:
+        """
+        Parse timestamp strings with O(unique) strptime work
+
+        Second-resolution log timestamps repeat heavily, so factorize
+        first: only the unique strings go through to_datetime and the
+        result fans back out by code — cheaper than to_datetime's own
+        per-value cache dict when the unique ratio is low.
+
+        Lines can match LOG_PATTERN yet carry an impossible date (the
+        day group is just digits, so "Jan 99" is reachable); those
+        coerce to NaT here and callers drop and count them per row, the
+        same contract parse_log_line keeps with its ValueError handler.
+        """
+        codes, uniques = pd.factorize(ts_strs)
+        parsed = pd.to_datetime(uniques, format='%Y %b %d %H:%M:%S',
+                                errors='coerce')
+        return parsed.take(codes)
+
+    def _frame_from_byte_fields(self, columns) -> pd.DataFrame:
+        """
+        Build the typed frame from per-field bytes columns
+
+        Each field is decoded exactly once, column-wise; port and pid are
+        cast from ASCII-digit bytes straight to ints by NumPy with no
+        decode step at all.
+        """
+        months, days, times, pids, statuses, usernames, ips, ports = columns
+
+        month = pd.Series(months).str.decode('ascii')
+        day = pd.Series(days).str.decode('ascii')
+        time_ = pd.Series(times).str.decode('ascii')
+        ts_strs = str(self.year) + ' ' + month + ' ' + day + ' ' + time_
+        timestamps = self._parse_timestamps(ts_strs)
+
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'status': pd.Series(statuses).str.decode('ascii'),
+            'username': pd.Series(usernames).str.decode('ascii'),
+            'source_ip': pd.Series(ips).str.decode('ascii'),
+            'port': np.asarray(ports, dtype='S5').astype(np.uint16),
+            'pid': np.asarray(pids, dtype='S10').astype(np.uint32)
+        })
+
+        # Pattern matches with an impossible date came back NaT — drop
+        # them and account for them like any other failed parse
+        bad = df['timestamp'].isna()
+        if bad.any():
+            n_bad = int(bad.sum())
+            if len(self.failed_samples) < 5:
+                self.failed_samples.extend(
+                    (ts_strs[np.asarray(bad)] + ' [Error: invalid date]')
+                    .head(5 - len(self.failed_samples)).tolist()
+                )
+            self.parsed_count -= n_bad
+            self.failed_count += n_bad
+            df = df[~bad].reset_index(drop=True)
+
+        return df
+
+    def transform_parallel(self, path, n_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Parse a log file across CPU cores with byte-range workers
+
+        Line parsing is embarrassingly parallel: the file is split into
+        n_workers equal byte ranges snapped to newline boundaries, each
+        worker mmaps the file and runs the bytes-regex scan over its slice,
+        and the per-field columns are np.concatenate'd before the final
+        DataFrame build. No locks — ranges tile the file exactly once.
+
+        Args:
+            path: Path to the log file (workers reopen it by name)
+            n_workers: Process count (defaults to os.cpu_count())
+
+        Returns:
+            Pandas DataFrame with the same schema as transform_logs
+        """
+        path = str(path)
+        n_workers = n_workers or os.cpu_count() or 1
+        size = os.path.getsize(path)
+
+        # mmap rejects zero-length files — degrade to the same empty-frame
+        # report the other transform paths give on empty input
+        if size == 0:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        bounds = [size * i // n_workers for i in range(n_workers + 1)]
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(
+                _parse_range, repeat(path), bounds[:-1], bounds[1:]
+            ))
+
+        columns = tuple(
+            np.concatenate([r[0][i] for r in results]) for i in range(8)
+        )
+        total_lines = sum(r[1] for r in results)
+        matched = len(columns[0])
+        self.parsed_count += matched
+        self.failed_count += max(total_lines, matched) - matched
+
+        if not matched:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        df = self._frame_from_byte_fields(columns)
+        if df.empty:
+            self._report_parse_failure()
+            return df
+        df = self._add_derived_columns(df)
+        self._report_parse_summary()
+        return df
+
+    def _parse_lines(self, raw_logs: List[str]) -> Dict[str, list]:
+        """
+        Parse a batch of raw lines into per-field columns
+
+        Appends each capture into its own list instead of building one
+        dict per row — no per-row dict allocation, and the caller can
+        construct the DataFrame column-wise without pandas' O(N*k)
+        list-of-dicts pivot and dtype inference. Updates parse counters.
+        """
+        timestamps, statuses, usernames = [], [], []
+        ips, ports, pids = [], [], []
+
         for log_line in raw_logs:
-            parsed = self.parse_log_line(log_line)
-            if parsed:
-                parsed_logs.append(parsed)
-                self.parsed_count += 1
-            else:
+            match = self.LOG_PATTERN.search(log_line)
+            if not match:
+                if len(self.failed_samples) < 5:
+                    self.failed_samples.append(log_line.strip())
                 self.failed_count += 1
-        
-        # FIXED: Handle empty results gracefully
-        if not parsed_logs:
-            print("❌ ERROR: No logs could be parsed!")
-            if self.failed_samples:
-                print("\nSample failed entries:")
-                for sample in self.failed_samples:
-                    print(f"  {sample}")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(parsed_logs)
-        
-        # Add derived columns
-        df['is_failed_login'] = df['status'] == 'Failed'
-        df['hour_of_day'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        
-        # FIXED: Use the improved internal IP detection
-        df['is_internal_ip'] = df['source_ip'].apply(self._is_internal_ip)
-        
-        # Additional derived fields
-        df['date'] = df['timestamp'].dt.date
-        df['weekday_name'] = df['timestamp'].dt.day_name()
-        
+                continue
+
+            month, day, time, pid, status, username, ip, port = match.groups()
+            try:
+                timestamps.append(self._build_timestamp(month, day, time))
+            except (KeyError, ValueError) as e:
+                if len(self.failed_samples) < 5:
+                    self.failed_samples.append(f"{log_line.strip()} [Error: {e}]")
+                self.failed_count += 1
+                continue
+
+            statuses.append(status)
+            usernames.append(username)
+            ips.append(ip)
+            ports.append(port)
+            pids.append(pid)
+            self.parsed_count += 1
+
+        return {'timestamp': timestamps, 'status': statuses,
+                'username': usernames, 'source_ip': ips,
+                'port': ports, 'pid': pids}
+
+    def _report_parse_failure(self) -> None:
+        """Print diagnostics when nothing could be parsed"""
+        print("❌ ERROR: No logs could be parsed!")
+        if self.failed_samples:
+            print("\nSample failed entries:")
+            for sample in self.failed_samples:
+                print(f"  {sample}")
+
+    def _report_parse_summary(self) -> None:
+        """Print parse counts and success rate"""
         # FIXED: Safe success rate calculation
         total_lines = self.parsed_count + self.failed_count
         success_rate = (self.parsed_count / total_lines * 100) if total_lines > 0 else 0
-        
+
         print(f"✓ Transformed {self.parsed_count:,} log entries")
         if self.failed_count > 0:
             print(f"  ⚠ Failed to parse: {self.failed_count:,} ({100 - success_rate:.1f}%)")
@@ -148,9 +595,142 @@ class LogTransformer:
                 for sample in self.failed_samples[:3]:
                     print(f"    {sample}")
         print(f"  ✓ Success rate: {success_rate:.1f}%")
-        
+
+    @staticmethod
+    def _iter_batches(lines: Iterable[str],
+                      batch_size: int = 200_000) -> Iterator[List[str]]:
+        """Batch an arbitrary line iterator into bounded lists via islice"""
+        iterator = iter(lines)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def transform_logs(self, raw_logs: Iterable[str]) -> pd.DataFrame:
+        """
+        Transform raw log lines into structured DataFrame
+
+        Accepts any iterable of lines. Generators (e.g.
+        LogExtractor.extract_logs_streaming) are consumed in bounded
+        200k-line batches, fusing extract and parse so each raw line is
+        parsed and dropped without materializing the whole file.
+
+        Args:
+            raw_logs: Iterable of raw log line strings
+
+        Returns:
+            Pandas DataFrame with parsed log data
+        """
+        if not isinstance(raw_logs, list):
+            return self.transform_logs_chunked(self._iter_batches(raw_logs))
+
+        df = self._extract_batch(raw_logs)
+
+        # FIXED: Handle empty results gracefully
+        if df.empty:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        # Add derived columns
+        df = self._add_derived_columns(df)
+
+        self._report_parse_summary()
+
+        return df
+
+    def transform_logs_python(self, raw_logs: List[str]) -> pd.DataFrame:
+        """
+        Reference per-line parse path
+
+        Kept as a fallback for debugging and line-at-a-time streaming use;
+        transform_logs is the vectorized default. Builds the frame from
+        per-field typed columns rather than a list of row dicts.
+        """
+        columns = self._parse_lines(raw_logs)
+
+        if not columns['timestamp']:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        df = pd.DataFrame({
+            'timestamp': pd.Series(columns['timestamp'], dtype='datetime64[ns]'),
+            'status': pd.array(columns['status'], dtype='string[pyarrow]'),
+            'username': pd.array(columns['username'], dtype='string[pyarrow]'),
+            'source_ip': pd.array(columns['source_ip'], dtype='string[pyarrow]'),
+            'port': np.array(columns['port']).astype(np.uint16),
+            'pid': np.array(columns['pid']).astype(np.uint32)
+        })
+        df = self._add_derived_columns(df)
+
+        self._report_parse_summary()
+
         return df
 
+    def transform_logs_chunked(self, chunks: Iterable[List[str]]) -> pd.DataFrame:
+        """
+        Transform an iterable of raw-line batches into one DataFrame
+
+        Pairs with LogExtractor.extract_logs_chunked: raw text is held in
+        memory one bounded batch at a time, while the much smaller typed
+        chunks are concatenated at the end. Keeps peak memory constant in
+        the raw-line dimension for files larger than RAM.
+
+        Args:
+            chunks: Iterable yielding lists of raw log lines
+
+        Returns:
+            Pandas DataFrame with parsed log data
+        """
+        frames = []
+        for chunk in chunks:
+            parsed = self._extract_batch(chunk)
+            if not parsed.empty:
+                frames.append(parsed)
+
+        if not frames:
+            self._report_parse_failure()
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        df = self._add_derived_columns(df)
+
+        self._report_parse_summary()
+
+        return df
+
+def _parse_range(path: str, start: int, end: int) -> Tuple[list, int]:
+    """
+    Worker for transform_parallel: parse one byte range of a log file
+
+    Snaps [start, end) to newline boundaries — a worker owns the lines
+    that begin inside its range, so consecutive ranges tile the file with
+    no overlap. Runs at module level so ProcessPoolExecutor can pickle it.
+
+    Returns:
+        ([eight per-field object arrays of bytes], line count in range)
+    """
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = mm.size()
+        if start:
+            nl = mm.find(b'\n', start - 1, size)
+            start = nl + 1 if nl != -1 else size
+        if end < size:
+            nl = mm.find(b'\n', end - 1, size)
+            end = nl + 1 if nl != -1 else size
+
+        fields = tuple([] for _ in range(8))
+        for m in LogTransformer.LOG_PATTERN_BYTES.finditer(mm, start, end):
+            for col, val in zip(fields, m.groups()):
+                col.append(val)
+
+        total_lines = int(
+            (np.frombuffer(mm, dtype=np.uint8)[start:end] == 0x0A).sum()
+        )
+
+    return [np.asarray(col, dtype=object) for col in fields], total_lines
+
 if __name__ == "__main__":
     # Test the transformer
     test_logs = [